@@ -29,11 +29,20 @@ def load_week(start_day: date, end_day: date):
 
     cutoff: int = songs[59]['plays']
     print(f'Song cutoff this week is {cutoff} plays.')
-    songs = [i for i in songs if i['plays'] >= cutoff]
-    for i in songs:
-        i['place'] = len([j for j in songs if j['plays'] > i['plays']]) + 1
+    songs = sorted(
+        (i for i in songs if i['plays'] >= cutoff),
+        key=itemgetter('plays'),
+        reverse=True,
+    )
+
+    # songs are sorted, so places only change when the plays do
+    place, prev_plays = 0, None
+    for (count, song) in enumerate(songs, start=1):
+        if song['plays'] != prev_plays:
+            place, prev_plays = count, song['plays']
+        song['place'] = place
 
-    return sorted(songs, key=itemgetter('plays'), reverse=True)
+    return songs
 
 
 def ask_new_song(uow: SongUOW, song_id: str) -> Song:
@@ -14,6 +14,7 @@ Abstract Classes:
     The base class of both SongCert and AlbumCert.
 """
 
+import functools
 import operator
 from abc import ABC, abstractmethod
 from enum import Enum
@@ -87,8 +88,15 @@ class AbstractCert(ABC):
             raise ValueError(
                 'Multiplier / Units need to be a nonnegative int.'
             )
-        self._mult = int(mult)
-        self._cert = cert
+        # certifications can't be changed once they're made
+        object.__setattr__(self, '_mult', int(mult))
+        object.__setattr__(self, '_cert', cert)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable.')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable.')
 
     @classmethod
     @abstractmethod
@@ -271,9 +279,11 @@ class SongCert(AbstractCert):
     __slots__ = ()
 
     @classmethod
+    @functools.lru_cache(maxsize=256)
     def from_units(cls, units: NonNegativeInt) -> 'SongCert':
         """
-        Constructs a SongCert from units. Returns a new SongCert object.
+        Constructs a SongCert from units. Certifications are immutable, so
+        repeated unit counts can share the same SongCert object.
         """
 
         mult = 0
@@ -20,11 +20,20 @@ import random
 from datetime import date, datetime
 from typing import Final, Literal, Union
 from pydantic import NonNegativeInt
+from requests.adapters import HTTPAdapter
 
 from . import config
 
 MIN_PLAYS: Final[int] = 1
 MAX_ENTRIES: Final[int] = 10000
+MAX_CONNECTIONS: Final[int] = 32
+
+# one session for every request, so the connections to the stats.fm api
+# get kept alive and reused instead of reconnecting for every request.
+# the pool is sized for threaded callers, since connections past the
+# default of 10 would get thrown out after each request.
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_maxsize=MAX_CONNECTIONS))
 
 
 def date_to_timestamp(day: date) -> int:
@@ -62,7 +71,7 @@ def _get_address(address: str) -> requests.Response:
     else:
         sneaky_address = address + '?korea=' + addon
 
-    response = requests.get(sneaky_address, headers=HEADERS)
+    response = _session.get(sneaky_address, headers=HEADERS)
     response.raise_for_status()
     return response
 
@@ -1,6 +1,8 @@
 import json
 from typing import Iterator, Optional
 
+import orjson
+
 from .model import Song, config
 
 
@@ -33,8 +35,8 @@ class SongRepository:
         self._load()
 
     def _load(self) -> None:
-        with open(self._file, 'r') as f:
-            songs: dict[str, dict] = json.load(f)
+        with open(self._file, 'rb') as f:
+            songs: dict[str, dict] = orjson.loads(f.read())
 
         self._songs.clear()
         merged = {}
@@ -138,5 +140,7 @@ class SongUOW:
             if song_id != song['id']:
                 songs[song_id] = {'merge': song['id']}
 
+        # json.dump writes every little token separately, so serialize
+        # the songs first and write the file all at once
         with open(self.songs._file, 'w') as f:
-            json.dump(songs, f, indent=4)
+            f.write(json.dumps(songs, indent=4))
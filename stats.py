@@ -1,71 +1,126 @@
 import functools
+import heapq
 import itertools
 from concurrent import futures
 from datetime import datetime, timedelta
-from typing import Iterator, Optional
+from typing import Iterable, Optional, Sequence
 
 from main.model import Song, SongCert, spotistats
 from main.storage import SongUOW
 
-uow = SongUOW()
+MILESTONES = [25, 50, 75, 100, 150, 200, 250, 300, 350, 400]
 
 
-def get_song_play_history(song: Song) -> Iterator[dict]:
-    with futures.ThreadPoolExecutor() as executor:
-        # make song main id into list to add to alternate ids
-        mapped = executor.map(
-            spotistats.song_play_history, ([song.id] + song.alt_ids)
-        )
+@functools.lru_cache(maxsize=None)
+def _song_history_sorted(song_ids: tuple[str, ...]) -> tuple[datetime, ...]:
+    """
+    The times that a song (under all of its ids) finished playing, from
+    earliest to latest. Cached so that every milestone checked for the
+    same song shares one set of requests.
+    """
 
-    return list(itertools.chain(*mapped))
+    # songs are already looked up in parallel by `top_milestones`, so the
+    # few ids of one song get fetched one after another
+    plays = itertools.chain.from_iterable(
+        map(spotistats.song_play_history, song_ids)
+    )
 
+    return tuple(sorted(i['finished_playing'] for i in plays))
 
-def time_to_plays(song: Song, plays: int) -> timedelta:
-    play_record = get_song_play_history(song)
 
-    if len(play_record) < plays:
-        raise ValueError('not enough plays for song')
+def time_to_milestones(
+    song: Song, milestones: Iterable[int]
+) -> dict[int, timedelta]:
+    """
+    How long it took the song to get to each of the play `milestones`
+    after its first play, for every milestone the song has reached.
+    """
 
-    play_record.sort(key=lambda i: i['finished_playing'])
-    first_play: datetime = play_record[0]['finished_playing']
-    wanted_play: datetime = play_record[plays - 1]['finished_playing']
+    play_record = _song_history_sorted((song.id, *song.alt_ids))
 
-    time = wanted_play - first_play
+    if not play_record:
+        return {}
 
-    return (song, time)
+    first_play: datetime = play_record[0]
 
+    return {
+        plays: play_record[plays - 1] - first_play
+        for plays in milestones
+        if plays <= len(play_record)
+    }
 
-def top_shortest_time_plays_milestones(uow: SongUOW, plays: int):
-    contenders = (song for song in uow.songs if song.plays >= plays)
 
-    with futures.ThreadPoolExecutor() as executor:
-        mapped = executor.map(
-            functools.partial(time_to_plays, plays=plays), contenders
-        )
-
-    units = [i for i in mapped if i[1].days > 1]
+def _show_fastest_songs(plays: int, units: list[tuple[Song, timedelta]]):
+    units = [i for i in units if i[1].days > 1]
     units.sort(key=lambda i: i[1])
-    if len(units) > 16:
-        units = [i for i in units if i[1] <= units[19][1]]
+    if units:
+        cutoff = units[min(19, len(units) - 1)][1]
+        units = [i for i in units if i[1] <= cutoff]
     print(f'Fastest songs to reach {plays} plays:')
-    for (song, time) in units:
-        place = len([unit for unit in units if unit[1].days < time.days]) + 1
+
+    # units are sorted, so places only change when the days do
+    place, prev_days = 0, None
+    for (count, (song, time)) in enumerate(units, start=1):
+        if time.days != prev_days:
+            place, prev_days = count, time.days
         print(f'{place:<2} | {song:<60} | {time.days} days')
     print('')
 
 
+def top_shortest_time_plays_milestones(uow: SongUOW, plays: int):
+    """Shows the fastest songs to reach `plays` plays."""
+    top_milestones(uow, [plays])
+
+
+def top_milestones(uow: SongUOW, milestones: Sequence[int] = MILESTONES):
+    """
+    Shows the fastest songs to reach every one of the play `milestones`,
+    from the biggest milestone down. Each song's play history only gets
+    looked at once for all of the milestones.
+    """
+
+    # songs with alternate ids show up once for each id
+    least_plays = min(milestones)
+    contenders = list(
+        dict.fromkeys(song for song in uow.songs if song.plays >= least_plays)
+    )
+
+    with futures.ThreadPoolExecutor(
+        max_workers=spotistats.MAX_CONNECTIONS
+    ) as executor:
+        mapped = executor.map(
+            functools.partial(time_to_milestones, milestones=milestones),
+            contenders,
+        )
+        song_times = list(zip(contenders, mapped))
+
+    for plays in sorted(milestones, reverse=True):
+        units = [
+            (song, times[plays])
+            for (song, times) in song_times
+            if plays in times
+        ]
+        _show_fastest_songs(plays, units)
+
+
 def top_song_consecutive_weeks(uow: SongUOW, top: Optional[int]):
     units: list[tuple[Song, int]] = [
         (song, song.get_conweeks(top)) for song in uow.songs
     ]
+    if units:
+        # only the top 20 (and anything tied with 20th) get displayed, so
+        # find that cutoff without sorting every song first
+        cutoff = heapq.nlargest(20, (i[1] for i in units))[-1]
+        units = [i for i in units if i[1] >= cutoff and i[1] > 1]
     units.sort(key=lambda i: i[1], reverse=True)
-    units = [i for i in units if i[1] >= units[19][1] and i[1] > 1]
 
     print(
         f"Songs with most consecutive weeks {f'in the top {top}' if top else 'on chart'}:"
     )
-    for (song, weeks) in units:
-        place = len([unit for unit in units if unit[1] > weeks]) + 1
+    place, prev_weeks = 0, None
+    for (count, (song, weeks)) in enumerate(units, start=1):
+        if weeks != prev_weeks:
+            place, prev_weeks = count, weeks
         print(
             f"{place:>2} | {f'{song.name} by {song.str_artists}':<55} | {weeks:>2} wks"
         )
@@ -82,12 +137,9 @@ def display_all_songs(uow: SongUOW):
         )
 
 
-MILESTONES = [25, 50, 75, 100, 150, 200, 250, 300, 350, 400]
-
 if __name__ == '__main__':
     uow = SongUOW()
 
-    for milestone in MILESTONES[::-1]:
-        top_shortest_time_plays_milestones(uow, milestone)
+    top_milestones(uow)
 
     display_all_songs(uow)
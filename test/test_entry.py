@@ -5,48 +5,40 @@ import pytest
 from ..main.model import Entry
 
 
-@pytest.mark.parametrize(
-    ('start', 'end', 'plays', 'place'),
-    [
+@pytest.fixture(
+    scope='module',
+    params=[
         (date(2000, 1, 1), date(2000, 1, 7), 20, 13),
         ('2000-01-01', '2000-01-07', 20, 13),
         (date(2000, 1, 1), date(2000, 1, 7), 20.0, 13.0),
     ],
+    ids=['date-ints', 'str-ints', 'date-floats'],
 )
-def test_creating_entry_types(start, end, plays, place):
-    entry = Entry(**locals())
+def entry_case(request) -> Entry:
+    """the same entry, built from each kind of input that's accepted."""
+    start, end, plays, place = request.param
+    return Entry(start=start, end=end, plays=plays, place=place)
 
+
+def test_creating_entry_types(entry_case: Entry):
     type_tuples = [
-        (entry.start, date),
-        (entry.end, date),
-        (entry.plays, int),
-        (entry.place, int),
+        (entry_case.start, date),
+        (entry_case.end, date),
+        (entry_case.plays, int),
+        (entry_case.place, int),
     ]
 
-    for items in type_tuples:
-        assert isinstance(*items)
-
-
-@pytest.mark.parametrize(
-    ('start', 'end', 'plays', 'place'),
-    [
-        (date(2000, 1, 1), date(2000, 1, 7), 20, 13),
-        ('2000-01-01', '2000-01-07', 20, 13),
-        (date(2000, 1, 1), date(2000, 1, 7), 20.0, 13.0),
-    ],
-)
-def test_creating_entry_values(start, end, plays, place):
-    entry = Entry(**locals())
+    for (value, kind) in type_tuples:
+        assert isinstance(value, kind)
 
-    type_tuples = [
-        (entry.start, date(2000, 1, 1)),
-        (entry.end, date(2000, 1, 7)),
-        (entry.plays, 20),
-        (entry.place, 13),
-    ]
 
-    for item, value in type_tuples:
-        assert item == value
+def test_creating_entry_values(entry_case: Entry):
+    assert (
+        entry_case.start,
+        entry_case.end,
+        entry_case.plays,
+        entry_case.place,
+    ) == (date(2000, 1, 1), date(2000, 1, 7), 20, 13)
 
 
 @pytest.mark.parametrize(
@@ -55,6 +47,7 @@ def test_creating_entry_values(start, end, plays, place):
         {'start': '2000-01-01', 'end': '2000-01-07', 'plays': 30, 'place': 13},
         {'start': '2013-04-12', 'end': '2013-04-19', 'plays': 34, 'place': 5},
     ],
+    ids=['2000-01-01', '2013-04-12'],
 )
 def test_creating_dict(info: dict):
     entry = Entry(**info)
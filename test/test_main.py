@@ -0,0 +1,58 @@
+import importlib.util
+import pathlib
+
+import pytest
+
+# `main.py` shares its name with the `main` package, so it has to be
+# loaded from its path instead of imported.
+_spec = importlib.util.spec_from_file_location(
+    'levboard_main', pathlib.Path(__file__).parents[1] / 'main.py'
+)
+levboard_main = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(levboard_main)
+
+
+def _week(plays: list[int]) -> list[dict]:
+    """a week of songs from `spotistats.songs_week`, most plays first."""
+    return [{'plays': p, 'id': str(i)} for (i, p) in enumerate(plays)]
+
+
+@pytest.mark.parametrize(
+    ('plays', 'places'),
+    [
+        ([10, 10, 8] + [2] * 57, [1, 1, 3] + [4] * 57),
+        ([9, 8, 8, 8, 7] + [2] * 55, [1, 2, 2, 2, 5] + [6] * 55),
+        (list(range(80, 20, -1)), list(range(1, 61))),
+    ],
+    ids=['tied-first', 'tied-middle', 'no-ties'],
+)
+def test_load_week_places(
+    monkeypatch, plays: list[int], places: list[int]
+):
+    monkeypatch.setattr(
+        levboard_main.spotistats, 'songs_week', lambda *_: _week(plays)
+    )
+
+    songs = levboard_main.load_week(None, None)
+
+    assert [i['place'] for i in songs] == places
+
+
+def test_load_week_keeps_ties_with_sixtieth(monkeypatch):
+    plays = list(range(100, 41, -1)) + [5, 5, 5, 4]
+    monkeypatch.setattr(
+        levboard_main.spotistats, 'songs_week', lambda *_: _week(plays)
+    )
+
+    songs = levboard_main.load_week(None, None)
+
+    assert [i['place'] for i in songs] == list(range(1, 60)) + [60] * 3
+
+
+def test_load_week_needs_sixty_songs(monkeypatch):
+    monkeypatch.setattr(
+        levboard_main.spotistats, 'songs_week', lambda *_: _week([3] * 59)
+    )
+
+    with pytest.raises(ValueError):
+        levboard_main.load_week(None, None)
@@ -1,100 +1,112 @@
-import json
+import pathlib
+import shutil
 
+import orjson
 import pytest
 
-from main.model import Album, Song
+from main.model import Song
 from main.storage import SongUOW
 
-TEST_UOW_PATH = 'C:/Users/levpo/Documents/GitHub/lev-bot/song/test.json'
-TEST_ALBUM_PATH = 'C:/Users/levpo/Documents/GitHub/lev-bot/song/testalbum.py'
 NO_BRAINER = '8191852'
 NO_TEARS_LEFT_TO_CRY = '78715'
-BREATHIN = '78710'
 MERGE = '5207830'
 
 
-def test_merge():
-    uow = SongUOW(song_file=TEST_UOW_PATH)
-    NO_BRAINER = '8191852'
-    MERGE = '5207830'
-    with uow:
-        no_brainer = uow.songs.get(NO_BRAINER)
-        merge = uow.songs.get(MERGE)
+def _song_dict(song_id: str, name: str, artists: list[str], **info) -> dict:
+    """a stored song, in the same form that `Song.to_dict()` makes."""
+    return {
+        'name': name,
+        'id': song_id,
+        'alt_ids': info.get('alt_ids', []),
+        'artists': artists,
+        'official_name': name,
+        'plays': info.get('plays', 0),
+        'entries': [
+            {'start': start, 'end': end, 'place': place, 'plays': plays}
+            for (start, end, place, plays) in info.get('entries', [])
+        ],
+    }
+
+
+# only the songs that the tests use, so the corpus stays tiny
+TEST_SONGS = {
+    NO_BRAINER: _song_dict(
+        NO_BRAINER,
+        'No Brainer',
+        ['DJ Khaled', 'Justin Bieber', 'Chance the Rapper', 'Quavo'],
+        alt_ids=[MERGE],
+        plays=36,
+    ),
+    MERGE: {'merge': NO_BRAINER},
+    NO_TEARS_LEFT_TO_CRY: _song_dict(
+        NO_TEARS_LEFT_TO_CRY,
+        'no tears left to cry',
+        ['Ariana Grande'],
+        entries=[
+            ('2022-11-19', '2022-11-26', 56, 2),
+            ('2022-11-26', '2022-12-03', 38, 3),
+            ('2022-12-03', '2022-12-10', 40, 2),
+            ('2022-12-31', '2023-01-07', 40, 2),
+        ],
+    ),
+}
+
+
+@pytest.fixture(scope='session')
+def test_corpus(tmp_path_factory) -> pathlib.Path:
+    """The song file holding `TEST_SONGS`, shared by every read-only test."""
+    song_file = tmp_path_factory.mktemp('data') / 'songs.json'
+    song_file.write_bytes(orjson.dumps(TEST_SONGS))
+    return song_file
+
+
+@pytest.fixture(scope='session')
+def uow_dir(tmp_path_factory, test_corpus: pathlib.Path) -> pathlib.Path:
+    """
+    A disposable copy of the test song file, for the tests that write to
+    their files, so that the shared test song file never changes.
+    """
+    folder = tmp_path_factory.mktemp('uow')
+    shutil.copy(test_corpus, folder / 'test.json')
+    return folder
+
+
+@pytest.fixture(scope='session')
+def testuow(test_corpus: pathlib.Path) -> SongUOW:
+    return SongUOW(song_file=str(test_corpus))
+
+
+@pytest.fixture(scope='session')
+def ntltc(testuow: SongUOW) -> Song:
+    return testuow.songs.get(NO_TEARS_LEFT_TO_CRY)
+
+
+def test_merge(testuow: SongUOW):
+    with testuow:
+        no_brainer = testuow.songs.get(NO_BRAINER)
+        merge = testuow.songs.get(MERGE)
         assert merge is no_brainer
 
 
-def test_merge_storage():
-    uow = SongUOW(song_file=TEST_UOW_PATH)
-    with open(TEST_UOW_PATH, 'r') as f:
-        initial_json = json.load(f)
+def test_merge_storage(uow_dir: pathlib.Path):
+    song_file = str(uow_dir / 'test.json')
+    uow = SongUOW(song_file=song_file)
+    initial_json = orjson.loads(pathlib.Path(song_file).read_bytes())
 
     with uow:
         _ = uow.songs.get(NO_BRAINER)
         print(uow.songs._songs)
         uow.commit()
 
-    with open(TEST_UOW_PATH, 'r') as f:
-        assert initial_json == json.load(f)
-
+    assert initial_json == orjson.loads(pathlib.Path(song_file).read_bytes())
 
-def test_conweeks_unchanged_entries():
-    uow = SongUOW()
-    song: Song = uow.songs.get(NO_TEARS_LEFT_TO_CRY)
 
-    prior = song.entries
+def test_conweeks_unchanged_entries(ntltc: Song):
+    prior = ntltc.entries
 
     for top in (None, 40, 20, 10, 5, 3, 1):
-        song.get_conweeks(top=top)
+        ntltc.get_conweeks(top=top)
 
-    after = song.entries
+    after = ntltc.entries
 
     assert prior == after
-
-
-def test_add_to_album():
-    uow = SongUOW()
-    ntltc: Song = uow.songs.get(NO_TEARS_LEFT_TO_CRY)
-
-    sweetener: Album = Album('Sweetener', 'Ariana Grande')
-
-    sweetener.add_song(ntltc)
-    assert ntltc in sweetener
-
-
-def test_add_songs_to_album():
-    uow = SongUOW()
-    ntltc: Song = uow.songs.get(NO_TEARS_LEFT_TO_CRY)
-    breathin: Song = uow.songs.get(BREATHIN)
-
-    sweetener: Album = Album('Sweetener', 'Ariana Grande')
-    sweetener.add_song(ntltc)
-    assert ntltc in sweetener
-    sweetener.add_song(breathin)
-    assert ntltc in sweetener
-    assert breathin in sweetener
-    assert len(sweetener.songs) == 2
-
-
-def test_album_storage():
-    with open(TEST_ALBUM_PATH, 'w') as f:
-        f.write(r'{}')
-
-    uow = SongUOW(album_file=TEST_ALBUM_PATH)
-    with uow:
-        sweetener = Album('Sweetener', 'Ariana Grande')
-        sweetener.add_song(uow.songs.get(NO_TEARS_LEFT_TO_CRY))
-        uow.albums.add(sweetener)
-        uow.commit()
-
-    del uow
-
-    uow = SongUOW(album_file=TEST_ALBUM_PATH)
-    with uow:
-        assert uow.albums.get('Sweetener') is not None
-
-
-def test_song_regeneration():
-    uow = SongUOW(album_file=TEST_ALBUM_PATH)
-    with uow:
-        sweetener = uow.albums.get('Sweetener')
-        assert sweetener
@@ -0,0 +1,199 @@
+from collections import Counter
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+
+from .. import stats
+from ..stats import (
+    _show_fastest_songs,
+    time_to_milestones,
+    top_milestones,
+    top_song_consecutive_weeks,
+)
+
+START = datetime(2022, 1, 1)
+
+
+def _places(output: str) -> list[int]:
+    """the places printed at the start of each ranked row of output."""
+    return [
+        int(line.split('|')[0])
+        for line in output.splitlines()
+        if line.split('|')[0].strip().isnumeric()
+    ]
+
+
+class _MilestoneSong(str):
+    """a stand in song that prints as its name, like `Song` does."""
+
+    def __new__(cls, name: str, song_id: str, *alt_ids: str, plays: int = 0):
+        song = super().__new__(cls, name)
+        song.id, song.alt_ids, song.plays = song_id, list(alt_ids), plays
+        return song
+
+
+def _daily_plays(count: int, offset: int = 0) -> list[dict]:
+    """`count` plays a day apart, the first one `offset` days after `START`."""
+    return [
+        {'finished_playing': START + timedelta(days=offset + i)}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def play_history(monkeypatch) -> SimpleNamespace:
+    """
+    Stands in for `spotistats.song_play_history`, giving back the plays
+    set in `histories` and counting how often each id gets `fetched`.
+    """
+    history = SimpleNamespace(histories={}, fetched=Counter())
+
+    def song_play_history(song_id: str) -> list[dict]:
+        history.fetched[song_id] += 1
+        return history.histories.get(song_id, [])
+
+    monkeypatch.setattr(
+        stats.spotistats, 'song_play_history', song_play_history
+    )
+    stats._song_history_sorted.cache_clear()
+    yield history
+    stats._song_history_sorted.cache_clear()
+
+
+def _conweeks_song(name: str, weeks: int) -> SimpleNamespace:
+    """a stand in song that always has `weeks` consecutive weeks."""
+    return SimpleNamespace(
+        name=name,
+        str_artists='Ariana Grande',
+        get_conweeks=lambda top: weeks,
+    )
+
+
+@pytest.mark.parametrize(
+    ('days', 'places'),
+    [
+        ([8, 8, 10], [1, 1, 3]),
+        ([10, 8, 10], [1, 2, 2]),
+        ([5, 6, 6, 6, 9], [1, 2, 2, 2, 5]),
+        ([7], [1]),
+        ([], []),
+    ],
+    ids=['tied-first', 'unsorted', 'tied-middle', 'single', 'empty'],
+)
+def test_fastest_songs_places(capsys, days: list[int], places: list[int]):
+    units = [(f'song {i}', timedelta(days=d)) for (i, d) in enumerate(days)]
+
+    _show_fastest_songs(25, units)
+
+    assert _places(capsys.readouterr().out) == places
+
+
+def test_fastest_songs_keeps_ties_with_twentieth(capsys):
+    units = [(f'song {i}', timedelta(days=10 + i)) for i in range(19)]
+    units += [(f'tied {i}', timedelta(days=40)) for i in range(3)]
+    units.append(('too slow', timedelta(days=41)))
+
+    _show_fastest_songs(25, units)
+
+    assert _places(capsys.readouterr().out) == list(range(1, 20)) + [20] * 3
+
+
+def test_fastest_songs_drops_first_day_units(capsys):
+    units = [('quick', timedelta(hours=5)), ('slow', timedelta(days=3))]
+
+    _show_fastest_songs(25, units)
+
+    output = capsys.readouterr().out
+    assert 'quick' not in output
+    assert _places(output) == [1]
+
+
+@pytest.mark.parametrize(
+    ('weeks', 'places'),
+    [
+        ([10, 10, 8], [1, 1, 3]),
+        ([3, 5, 5, 2], [1, 1, 3, 4]),
+        ([4, 1, 0], [1]),
+        ([], []),
+    ],
+    ids=['tied-first', 'unsorted', 'one-week-dropped', 'empty'],
+)
+def test_consecutive_weeks_places(
+    capsys, weeks: list[int], places: list[int]
+):
+    uow = SimpleNamespace(
+        songs=[_conweeks_song(f'song {i}', w) for (i, w) in enumerate(weeks)]
+    )
+
+    top_song_consecutive_weeks(uow, None)
+
+    assert _places(capsys.readouterr().out) == places
+
+
+@pytest.mark.parametrize('top', [None, 10])
+def test_consecutive_weeks_keeps_ties_with_twentieth(
+    capsys, top: Optional[int]
+):
+    weeks = list(range(40, 21, -1)) + [5, 5, 5, 4]
+    uow = SimpleNamespace(
+        songs=[_conweeks_song(f'song {i}', w) for (i, w) in enumerate(weeks)]
+    )
+
+    top_song_consecutive_weeks(uow, top)
+
+    assert _places(capsys.readouterr().out) == list(range(1, 20)) + [20] * 3
+
+
+def test_time_to_milestones_deltas(play_history: SimpleNamespace):
+    # plays under the alternate id come first, so both ids are counted
+    play_history.histories = {
+        'main': _daily_plays(30, offset=10),
+        'alt': _daily_plays(10),
+    }
+    song = _MilestoneSong('song', 'main', 'alt', plays=40)
+
+    times = time_to_milestones(song, [25, 40])
+
+    assert times == {25: timedelta(days=24), 40: timedelta(days=39)}
+
+
+def test_time_to_milestones_skips_unreached(play_history: SimpleNamespace):
+    play_history.histories = {'main': _daily_plays(30)}
+    song = _MilestoneSong('song', 'main', plays=30)
+
+    assert time_to_milestones(song, [25, 50]) == {25: timedelta(days=24)}
+
+
+def test_time_to_milestones_no_history(play_history: SimpleNamespace):
+    song = _MilestoneSong('song', 'main', plays=30)
+
+    assert time_to_milestones(song, [25, 50]) == {}
+
+
+def test_top_milestones_fetches_each_id_once(
+    capsys, play_history: SimpleNamespace
+):
+    play_history.histories = {
+        'fast': _daily_plays(60),
+        'slow': _daily_plays(20),
+        'slow alt': _daily_plays(20, offset=50),
+        'short': _daily_plays(30),
+    }
+    fast = _MilestoneSong('fast', 'fast', plays=60)
+    slow = _MilestoneSong('slow', 'slow', 'slow alt', plays=40)
+    short = _MilestoneSong('short', 'short', plays=30)
+    # merged songs show up once for each of their ids
+    uow = SimpleNamespace(songs=[fast, slow, slow, short])
+
+    top_milestones(uow, [25, 50])
+
+    assert play_history.fetched == Counter(
+        {'fast': 1, 'slow': 1, 'slow alt': 1, 'short': 1}
+    )
+    output = capsys.readouterr().out
+    fifty, twenty_five = output.split('Fastest songs to reach 25 plays:')
+    assert 'fast' in fifty and 'short' not in fifty and 'slow' not in fifty
+    assert _places(twenty_five) == [1, 1, 3]
+    assert '| 24 days' in twenty_five and '| 54 days' in twenty_five